@@ -12,15 +12,15 @@ class JobMetadataInjector(LoggerAdapter):
         super().__init__(logger, None)
         self._job = job
 
+        # The job's identity is fixed for the lifetime of the adapter, so
+        # the metadata prefix is built once here instead of per message
+        self._prefix = (
+            f'[product_id: {job.get("product_id")}, '
+            f'job_id: {job.get("job_id")}] '
+        )
+
     def process(self, msg, kwargs):
         if isinstance(msg, str):
-            return (
-                '[product_id: {}, job_id: {}] {}'.format(  # pylint: disable=consider-using-f-string # noqa: E501
-                    self._job.get('product_id'),
-                    self._job.get('job_id'),
-                    msg
-                ),
-                kwargs
-            )
+            return (self._prefix + msg, kwargs)
 
         return (msg, kwargs)
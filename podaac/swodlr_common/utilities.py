@@ -3,94 +3,101 @@ from abc import ABC
 import json
 import logging
 from importlib import resources
+from itertools import chain
 from os import getenv, path
+from pathlib import Path
 import re
 from tempfile import NamedTemporaryFile
 from urllib.parse import urlparse
 
-import boto3
 import fastjsonschema
-from elasticsearch import Elasticsearch
-from requests import Session
 
 import podaac.swodlr_common
 
+# orjson decodes/encodes JSON several times faster than the stdlib; fall
+# back to the stdlib when the optional dependency isn't installed
+try:
+    import orjson
 
-class _SemVer:
-    VERSION_RE = re.compile(r'(?<major>\d+)\.(?<minor>\d+).(?<patch>\d+)')
+    def _json_dumps(obj):
+        return orjson.dumps(obj).decode()
 
-    @staticmethod
-    def attempt_parse(semver_str):
-        '''
-        Attempts to parse a string into a SemVer object; if no semver-like
-        structures are found in the string, the method will return a None
-        '''
-        parsed_version = _SemVer.VERSION_RE.search(semver_str)
-        if parsed_version is None:
-            return None
-
-        return _SemVer(
-            parsed_version.group('major'),
-            parsed_version.group('minor'),
-            parsed_version.group('patch')
-        )
+    _json_loads = orjson.loads
+except ImportError:
+    _json_dumps = json.dumps
+    _json_loads = json.loads
 
-    def __init__(self, major, minor, patch):
-        self.major = int(major)
-        self.minor = int(minor)
-        self.patch = int(patch)
 
-    def __eq__(self, other) -> bool:
-        if not isinstance(other, type(self)):
-            return super().__eq__(other)
+_VERSION_RE = re.compile(r'(?P<major>\d+)\.(?P<minor>\d+)\.(?P<patch>\d+)')
 
-        return (
-            self.major == other.major and
-            self.minor == other.minor and
-            self.patch == other.patch
-        )
 
-    def __lt__(self, other) -> bool:
-        if not isinstance(other, type(self)):
-            return super().__lt__(other)
+def _resolve_schemas_dir():
+    '''
+    Resolve the schemas folder to a concrete filesystem path when possible
+    so schema reads bypass the importlib.resources traversal wrappers;
+    falls back to the Traversable for zipped installs
+    '''
+    schemas = resources.files(podaac.swodlr_common).joinpath('schemas')
+    concrete = Path(str(schemas))
+    return concrete if concrete.is_dir() else schemas
 
-        return (
-            self.major < other.major or
-            self.minor < other.minor or
-            self.patch < other.patch
-        )
 
-    def __gt__(self, other) -> bool:
-        if not isinstance(other, type(self)):
-            return super().__gt__(other)
+_SCHEMAS_DIR = _resolve_schemas_dir()
+
+
+def _load_schemas():
+    '''
+    Load and compile every schema in the schemas folder. Run once at module
+    import so steady-state lookups perform no file I/O or codegen
+    '''
+    raw_schemas = {}
+    for schema_resource in _SCHEMAS_DIR.iterdir():
+        if not schema_resource.name.endswith('.json'):
+            continue
+
+        name = schema_resource.name.removesuffix('.json')
+        raw_schemas[name] = _json_loads(schema_resource.read_bytes())
+
+    def resolve(name):
+        return raw_schemas[name.removeprefix('swodlr-')]
+
+    return {
+        name: fastjsonschema.compile(definition, handlers={'': resolve})
+        for name, definition in raw_schemas.items()
+    }
 
-        return (
-            self.major > other.major or
-            self.minor > other.minor or
-            self.patch > other.patch
-        )
 
-    def __le__(self, other) -> bool:
-        if not isinstance(other, type(self)):
-            return super().__le__(other)
+_COMPILED_SCHEMAS = _load_schemas()
 
-        return (self.__lt__(other) or self.__eq__(other))
 
-    def __ge__(self, other) -> bool:
-        if not isinstance(other, type(self)):
-            return super().__ge__(other)
+def _parse_semver(semver_str):
+    '''
+    Attempts to parse a string into a (major, minor, patch) tuple; if no
+    semver-like structure is found in the string, returns None. Tuples
+    compare lexicographically, so callers can sort and compare versions
+    directly
+    '''
+    parsed_version = _VERSION_RE.search(semver_str)
+    if parsed_version is None:
+        return None
 
-        return (self.__gt__(other) or self.__eq__(other))
+    return (
+        int(parsed_version.group('major')),
+        int(parsed_version.group('minor')),
+        int(parsed_version.group('patch'))
+    )
 
 
-class BaseUtilities(ABC):
+class BaseUtilities(ABC):  # pylint: disable=too-many-instance-attributes
     '''
     An abstract base utilities class that microservices should extend for their
     own specific requirements
     '''
 
+    _instance = None
+
     def __init__(self, app_name, service_name):
-        if hasattr(BaseUtilities, '_instance'):
+        if BaseUtilities._instance is not None:
             raise RuntimeError('Utilities were already initialized')
 
         BaseUtilities._instance = self
@@ -111,36 +118,26 @@ class BaseUtilities(ABC):
         Returns the already initiated instance of a subclass which extends
         BaseUtilities
         '''
-        if not hasattr(cls, '_instance'):
+        if cls._instance is None:
             raise RuntimeError('Utilities were not initialized yet')
 
         return cls._instance
 
     def _load_params_from_ssm(self):
+        import boto3  # noqa: E501 # pylint: disable=import-outside-toplevel
+
         ssm = boto3.client('ssm')
+        pages = ssm.get_paginator('get_parameters_by_path').paginate(
+            Path=self._ssm_path,
+            WithDecryption=True
+        )
 
-        parameters = []
-        next_token = None
-        while True:
-            kwargs = {'NextToken': next_token} \
-                if next_token is not None else {}
-            res = ssm.get_parameters_by_path(
-                Path=self._ssm_path,
-                WithDecryption=True,
-                **kwargs
+        self._ssm_parameters = {
+            param['Name'].removeprefix(self._ssm_path): param['Value']
+            for param in chain.from_iterable(
+                page['Parameters'] for page in pages
             )
-
-            parameters.extend(res['Parameters'])
-            if 'NextToken' in res:
-                next_token = res['NextToken']
-            else:
-                break
-
-        self._ssm_parameters = {}
-
-        for param in parameters:
-            name = param['Name'].removeprefix(self._ssm_path)
-            self._ssm_parameters[name] = param['Value']
+        }
 
     def _get_sds_session(self):
         '''
@@ -150,6 +147,8 @@ class BaseUtilities(ABC):
         OUTSIDE OF THIS UTILITY CLASS OR CREDENTIALS MAY LEAK
         '''
         if not hasattr(self, '_session'):
+            from requests import Session  # noqa: E501 # pylint: disable=import-outside-toplevel
+
             ca_cert = self.get_param('sds_ca_cert')
             username = self.get_param('sds_username')
             password = self.get_param('sds_password')
@@ -183,34 +182,26 @@ class BaseUtilities(ABC):
         Creates a logger for a requestor with a global log level defined from
         parameters
         '''
-        logger = logging.getLogger(name)
+        if not hasattr(self, '_log_level'):
+            log_level = self.get_param('log_level')
+            # pylint: disable-next=attribute-defined-outside-init
+            self._log_level = getattr(logging, log_level) \
+                if log_level is not None else logging.INFO
 
-        log_level = getattr(logging, self.get_param('log_level')) \
-            if self.get_param('log_level') is not None else logging.INFO
-        logger.setLevel(log_level)
+        logger = logging.getLogger(name)
+        logger.setLevel(self._log_level)
         return logger
 
     def load_json_schema(self, name):
         '''
-        Load a json schema from the schema folder and return the compiled
-        schema
+        Return the compiled schema for a json schema from the schema folder;
+        all schemas are loaded and compiled once at module import
         '''
-        def load_local(name):
-            name = name.removeprefix('swodlr-')
-            schemas = resources.files(podaac.swodlr_common) \
-                .joinpath('schemas')
-            schema_resource = schemas.joinpath(f'{name}.json')
-
-            if not schema_resource.is_file():
-                raise RuntimeError('Schema not found')
+        name = name.removeprefix('swodlr-')
+        if name not in _COMPILED_SCHEMAS:
+            raise RuntimeError('Schema not found')
 
-            with schema_resource.open('r', encoding='utf-8') as schema_json:
-                return json.load(schema_json)
-
-        return fastjsonschema.compile(
-            definition=load_local(name),
-            handlers={'': load_local}
-        )
+        return _COMPILED_SCHEMAS[name]
 
     def get_latest_job_version(self, job_name):
         '''
@@ -221,6 +212,8 @@ class BaseUtilities(ABC):
             return self.get_param('sds_pcm_release_tag')
 
         if not hasattr(self, '_sds_client'):
+            from elasticsearch import Elasticsearch  # noqa: E501 # pylint: disable=import-outside-toplevel
+
             base_sds_url = urlparse(self.get_param('sds_host'))
             base_path = base_sds_url.path
             mozart_es_path = path.joinpath(base_path, '/mozart_es/')
@@ -247,7 +240,7 @@ class BaseUtilities(ABC):
 
         job_versions = {}
         for result in results['hits']['hits']:
-            version = _SemVer.attempt_parse(result['_source']['job-version'])
+            version = _parse_semver(result['_source']['job-version'])
             if version is None:
                 # No semver compatible version found
                 continue
@@ -255,4 +248,4 @@ class BaseUtilities(ABC):
             if version not in job_versions:
                 job_versions[version] = result['_source']
 
-        return job_versions[sorted(job_versions.keys(), reverse=True)[0]]
+        return job_versions[max(job_versions)]